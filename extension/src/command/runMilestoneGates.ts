@@ -130,10 +130,10 @@ async function findNewestMilestoneSummary(repoRoot: string): Promise<string | nu
       return null;
     }
 
-    // Look for exec_* directories
-    const execDirs = fs.readdirSync(proofDir)
-      .filter(name => name.startsWith("exec_"))
-      .map(name => path.join(proofDir, name));
+    // Look for exec_* directories; Dirent types avoid a stat per entry
+    const execDirs = fs.readdirSync(proofDir, { withFileTypes: true })
+      .filter(entry => entry.isDirectory() && entry.name.startsWith("exec_"))
+      .map(entry => path.join(proofDir, entry.name));
 
     let newestSummary: { path: string; mtime: Date } | null = null;
 
@@ -142,14 +142,15 @@ async function findNewestMilestoneSummary(repoRoot: string): Promise<string | nu
       if (!fs.existsSync(milestoneDir)) continue;
 
       // Look for session directories
-      const sessionDirs = fs.readdirSync(milestoneDir)
-        .map(name => path.join(milestoneDir, name));
+      const sessionDirs = fs.readdirSync(milestoneDir, { withFileTypes: true })
+        .filter(entry => entry.isDirectory())
+        .map(entry => path.join(milestoneDir, entry.name));
 
       for (const sessionDir of sessionDirs) {
         const summaryFile = path.join(sessionDir, "summary.txt");
-        if (!fs.existsSync(summaryFile)) continue;
+        const stats = fs.statSync(summaryFile, { throwIfNoEntry: false });
+        if (!stats) continue;
 
-        const stats = fs.statSync(summaryFile);
         if (!newestSummary || stats.mtime > newestSummary.mtime) {
           newestSummary = { path: summaryFile, mtime: stats.mtime };
         }
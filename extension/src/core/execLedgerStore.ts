@@ -12,10 +12,17 @@ function atomicWriteJson(filePath: string, data: unknown): void {
   ensureDir(path.dirname(filePath));
   const tempPath = filePath + TEMP_SUFFIX;
   fs.writeFileSync(tempPath, JSON.stringify(data, null, 2), 'utf-8');
-  if (fs.existsSync(filePath)) {
-    fs.unlinkSync(filePath);
+
+  // rename replaces an existing target in one step; only fall back to
+  // unlink + rename if the platform refuses to overwrite.
+  try {
+    fs.renameSync(tempPath, filePath);
+  } catch {
+    if (fs.existsSync(filePath)) {
+      fs.unlinkSync(filePath);
+    }
+    fs.renameSync(tempPath, filePath);
   }
-  fs.renameSync(tempPath, filePath);
 }
 
 /**